@@ -16,16 +16,31 @@ from src.collector import ICLRCollector
 from src.storage import Storage
 
 def get_last_collected_year():
-    """Find the last successfully collected year from the JSONL file"""
+    """Find the last successfully collected year from the tail of the JSONL file"""
     storage = Storage()
     try:
-        papers = storage.read_papers()
+        papers = storage.read_last_papers()
         if papers:
             years = [p.get('year', 0) for p in papers]
             return max(years) if years else None
     except:
         return None
 
+def get_resume_year(completed_years, start_year=2016, end_year=2025):
+    """
+    Find the earliest year that still needs collecting
+    
+    Years run concurrently, so the file tail can hold a later year than one
+    left partial; the completed-years record is used when it exists.
+    """
+    if not completed_years:
+        # Files from runs before completed years were recorded
+        return get_last_collected_year()
+    for year in range(start_year, end_year + 1):
+        if year not in completed_years:
+            return year
+    return None
+
 def main():
     """Main execution function"""
     # Load environment variables
@@ -43,25 +58,34 @@ def main():
         # Remove the flag from args
         sys.argv.remove('--resume')
         
+        completed_years = collector.storage.completed_years()
+        
         # Check if a specific year is provided after --resume
         if len(sys.argv) > 1:
             start_year = int(sys.argv[1])
             print(f"📂 Resuming from year {start_year}...")
         else:
-            # Auto-detect last year
-            last_year = get_last_collected_year()
-            if last_year:
-                start_year = last_year + 1
-                print(f"📂 Detected last collected year: {last_year}")
+            # Auto-detect the earliest incomplete year
+            resume_year = get_resume_year(completed_years)
+            if resume_year:
+                # The year may be partial; its stored papers are skipped below
+                start_year = resume_year
+                print(f"📂 Detected first incomplete year: {resume_year}")
                 print(f"📂 Resuming from year {start_year}...")
+            elif completed_years:
+                start_year = 2026
+                print("📂 All years already collected")
             else:
                 start_year = 2016
                 print(f"📂 No existing data found, starting from {start_year}...")
         
-        # Don't clear the file when resuming
+        # Don't clear the file when resuming, and skip papers already in it
+        existing_ids = collector.storage.paper_ids()
         for year in range(start_year, 2026):
+            if year in completed_years:
+                continue
             try:
-                papers = collector.collect_year(year)
+                papers = collector.collect_year(year, skip_ids=existing_ids)
                 if year < 2025:
                     print("⏳ Waiting before next year...")
                     import time
@@ -3,13 +3,320 @@ OpenReview API client wrapper
 Handles both API v1 (2016-2022) and API v2 (2023-2025)
 """
 import openreview
+import random
+import re
+import requests
+import threading
 import time
-from typing import List, Any, Dict
-from tqdm import tqdm
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from statistics import median
+from typing import List, Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _status_of(error: Exception) -> Optional[int]:
+    """HTTP status behind a requests or OpenReview error, if known"""
+    response = getattr(error, 'response', None)
+    if response is not None:
+        return response.status_code
+    # OpenReviewException carries the API's JSON error body
+    if error.args and isinstance(error.args[0], dict):
+        return error.args[0].get('status')
+    return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Convert a rate-limit reset header (seconds, epoch or '1m30s') to seconds from now"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        parts = _DURATION_RE.findall(value)
+        if not parts:
+            return None
+        return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+    # Large values are epoch timestamps rather than deltas
+    if seconds > 1e9:
+        seconds -= time.time()
+    return max(0.0, seconds)
+
+
+class RateLimitState:
+    """
+    Track the rate-limit headers returned by OpenReview
+
+    Requests only pause when the remaining quota is nearly exhausted, and
+    then only until the advertised reset time.
+    """
+
+    REMAINING_HEADERS = ('x-ratelimit-remaining-requests', 'x-ratelimit-remaining')
+    LIMIT_HEADERS = ('x-ratelimit-limit-requests', 'x-ratelimit-limit')
+    RESET_HEADERS = ('x-ratelimit-reset-requests', 'x-ratelimit-reset')
+
+    def __init__(self, min_remaining: int = 2, fraction: float = 0.1):
+        """
+        Args:
+            min_remaining: Pause when at most this many requests are left
+            fraction: Lower the threshold to this share of small limits
+        """
+        self.min_remaining = min_remaining
+        self.fraction = fraction
+        self.remaining = None
+        self.limit = None
+        self.reset_at = None
+        # Shared by every thread; set on exhaustion, cleared by fresh headers
+        self.pause_until = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _header(headers, names):
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                return value
+        return None
+
+    def update(self, headers):
+        """Record the quota advertised by a response"""
+        remaining = self._header(headers, self.REMAINING_HEADERS)
+        if remaining is None:
+            return
+        try:
+            remaining = int(float(remaining))
+        except ValueError:
+            return
+        limit = self._header(headers, self.LIMIT_HEADERS)
+        reset = _parse_reset(self._header(headers, self.RESET_HEADERS))
+        with self._lock:
+            self.remaining = remaining
+            if limit is not None:
+                try:
+                    self.limit = int(float(limit))
+                except ValueError:
+                    pass
+            self.reset_at = time.monotonic() + reset if reset is not None else None
+            if not self.is_throttled():
+                self.pause_until = 0.0
+
+    def is_throttled(self) -> bool:
+        """Whether the remaining quota has dropped to the pause threshold"""
+        if self.remaining is None or self.reset_at is None:
+            return False
+        threshold = self.min_remaining
+        if self.limit:
+            threshold = min(threshold, self.fraction * self.limit)
+        return self.remaining <= threshold
+
+    def wait_if_throttled(self) -> float:
+        """
+        Sleep until the quota resets if it is nearly exhausted
+
+        Every caller waits for the same pause, not just the first one to
+        notice the exhausted quota.
+
+        Returns:
+            Seconds slept
+        """
+        with self._lock:
+            if self.is_throttled():
+                self.pause_until = max(self.pause_until, self.reset_at)
+            wait = self.pause_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+            return wait
+        return 0.0
+
+
+class BackpressureController:
+    """
+    AIMD concurrency controller shared by every OpenReview request
+
+    The in-flight limit c_t grows additively by alpha while latency stays
+    under L_target (twice the rolling median latency) and is multiplied by
+    beta when the server answers 429/5xx or the connection fails.
+    """
+
+    OVERLOAD_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, initial: float = 4.0, max_concurrency: float = 64.0,
+                 alpha: float = 0.5, beta: float = 0.5, window: int = 50,
+                 default_pause: float = 1.0):
+        """
+        Args:
+            initial: Starting in-flight request limit
+            max_concurrency: Upper bound for the in-flight limit
+            alpha: Additive increase per healthy response
+            beta: Multiplicative decrease factor on overload
+            window: Number of recent latencies used for L_target
+            default_pause: Pause after overload when no Retry-After is sent
+        """
+        self.c_t = initial
+        self.max_concurrency = max_concurrency
+        self.alpha = alpha
+        self.beta = beta
+        self.default_pause = default_pause
+        self.latencies = deque(maxlen=window)
+        self.in_flight = 0
+        self.resume_at = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def L_target(self) -> float:
+        """Latency above which the limit stops growing"""
+        if len(self.latencies) < 5:
+            return float('inf')
+        return 2 * median(self.latencies)
+
+    def before(self):
+        """Block until a request slot is free and any server pause is over"""
+        with self._cond:
+            while True:
+                wait = self.resume_at - time.monotonic()
+                if wait <= 0 and self.in_flight < max(1, int(self.c_t)):
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self.in_flight += 1
+
+    def after(self, latency: float, status: Optional[int], retry_after: Optional[float] = None):
+        """
+        Release a request slot and adapt the limit
+
+        Args:
+            latency: Seconds the request took
+            status: HTTP status code, or None if the request failed
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if status is None or status in self.OVERLOAD_STATUSES:
+                self.c_t = max(1.0, self.c_t * self.beta)
+                if status in (429, 503):
+                    pause = retry_after if retry_after is not None else self.default_pause
+                    self.resume_at = max(self.resume_at, time.monotonic() + pause)
+            else:
+                if latency <= self.L_target:
+                    self.c_t = min(self.max_concurrency, self.c_t + self.alpha)
+                self.latencies.append(latency)
+            self._cond.notify_all()
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that routes every request through the rate limiters"""
+
+    def __init__(self, controller: BackpressureController, rate_limit: RateLimitState, **kwargs):
+        self.controller = controller
+        self.rate_limit = rate_limit
+        # Status of the last response sent from each thread
+        self._local = threading.local()
+        super().__init__(**kwargs)
+
+    def last_status(self) -> Optional[int]:
+        """
+        HTTP status of this thread's most recent response
+
+        openreview drops the status when an error body isn't JSON (e.g. a
+        gateway's HTML 502), so callers read it from here instead.
+        """
+        return getattr(self._local, 'status', None)
+
+    def send(self, request, **kwargs):
+        self.rate_limit.wait_if_throttled()
+        self.controller.before()
+        start = time.monotonic()
+        status = None
+        retry_after = None
+        self._local.status = None
+        try:
+            response = super().send(request, **kwargs)
+            status = self._local.status = response.status_code
+            self.rate_limit.update(response.headers)
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            return response
+        finally:
+            self.controller.after(time.monotonic() - start, status, retry_after)
+
+
+def _normalize_v2_content(v2_content: Dict) -> Dict:
+    """Extract values from v2 nested content structure"""
+    if not isinstance(v2_content, dict):
+        return {}
+    return {
+        key: value['value'] if isinstance(value, dict) and 'value' in value else value
+        for key, value in v2_content.items()
+    }
+
+
+@dataclass(slots=True)
+class NoteWrapper:
+    """v2 note normalized to the v1 structure PaperProcessor expects"""
+    id: str
+    forum: str
+    signatures: List[str]
+    invitations: List[str]
+    number: Optional[int]
+    tcdate: Optional[int]
+    cdate: Optional[int]
+    content: Dict
+    details: Dict
+
+    @classmethod
+    def from_v2(cls, v2_note: Any) -> 'NoteWrapper':
+        """Wrap a v2 note, flattening content and exposing replies as directReplies"""
+        details = getattr(v2_note, 'details', None)
+        if details is None:
+            details = {'replies': [], 'directReplies': []}
+        elif 'replies' in details:
+            # Make sure replies are accessible as both 'replies' and 'directReplies'
+            details['directReplies'] = details['replies']
+
+        # Safe attribute extraction with defaults
+        return cls(
+            id=getattr(v2_note, 'id', ''),
+            forum=getattr(v2_note, 'forum', ''),
+            signatures=getattr(v2_note, 'signatures', []),
+            invitations=getattr(v2_note, 'invitations', []),
+            number=getattr(v2_note, 'number', None),
+            tcdate=getattr(v2_note, 'tcdate', None),
+            cdate=getattr(v2_note, 'cdate', None),
+            content=_normalize_v2_content(getattr(v2_note, 'content', {})),
+            details=details
+        )
+
 
 class OpenReviewClient:
     """Wrapper for OpenReview API with version handling"""
     
+    # Years only served by API v2; a v1 fallback there is wasted scans
+    _V2_CONFIRMED_YEARS = {2024, 2025}
+    # Results at least this large are trusted without trying other queries
+    _FALLBACK_MIN = 100
+    # Application-level retries on top of the transport's own retries
+    _RETRY_ATTEMPTS = 5
+    _RETRY_CAP = 30.0
+    _RETRY_STATUSES = {429, 500, 502, 503, 504}
+    
     def __init__(self, username: str = None, password: str = None):
         """Initialize both API v1 and v2 clients"""
         # API v2 for newer conferences (2023+)
@@ -25,6 +332,64 @@ class OpenReviewClient:
             username=username,
             password=password
         )
+
+        # Pace every HTTP request (including get_all_notes pagination)
+        self.backpressure = BackpressureController()
+        self.rate_limit = RateLimitState()
+        
+        # Share one pooled keep-alive session between both clients
+        self.session = self._build_session()
+        self.client_v1.session = self.session
+        self.client_v2.session = self.session
+
+    def _build_session(self) -> requests.Session:
+        """Create the throttled session with a 64-connection pool per host"""
+        adapter = _ThrottledAdapter(
+            self.backpressure,
+            self.rate_limit,
+            pool_connections=64,
+            pool_maxsize=64,
+            # Only connection failures are retried here; 429/5xx responses
+            # reach the controller (and its Retry-After pause) and are
+            # retried by _retry, so every attempt is paced
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(),
+                respect_retry_after_header=False
+            )
+        )
+        self._adapter = adapter
+        session = requests.Session()
+        session.headers['Connection'] = 'keep-alive'
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _retry(self, fn, *args, **kwargs):
+        """
+        Call an API method, retrying transient failures with jittered exponential backoff
+        
+        Connection errors, timeouts, exhausted transport retries and
+        429/5xx API errors are retried; anything else is raised at once.
+        """
+        for attempt in range(self._RETRY_ATTEMPTS):
+            try:
+                return fn(*args, **kwargs)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.RetryError,
+                    openreview.OpenReviewException) as e:
+                if isinstance(e, openreview.OpenReviewException):
+                    # Non-JSON error bodies carry no status; use the response's
+                    status = _status_of(e)
+                    if status is None:
+                        status = self._adapter.last_status()
+                    if status not in self._RETRY_STATUSES:
+                        raise
+                if attempt == self._RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(min(self._RETRY_CAP, 2 ** attempt + random.random()))
     
     def get_client(self, year: int):
         """Select appropriate client based on year"""
@@ -44,9 +409,13 @@ class OpenReviewClient:
             if year >= 2024:
                 # Use the v2 submissions method which handles wrapping
                 submissions = self._get_v2_submissions(year)
-                if not submissions:
-                    print(f"  API v2 returned no results, falling back to API v1...")
-                    submissions = self._get_v1_submissions(year)
+                if year in self._V2_CONFIRMED_YEARS or len(submissions) >= self._FALLBACK_MIN:
+                    return submissions
+                
+                print(f"  API v2 returned {len(submissions)} results, falling back to API v1...")
+                fallback = self._get_v1_submissions(year)
+                if len(fallback) > len(submissions):
+                    submissions = fallback
             else:
                 # API v1 for pre-2024
                 submissions = self._get_v1_submissions(year)
@@ -59,12 +428,20 @@ class OpenReviewClient:
             traceback.print_exc()
             return []
 
-    def _get_v1_reviews_separately(self, forum_id: str, year: int) -> List[Any]:
-        """
-        Fetch reviews separately for papers (needed for 2016-2017)
+    def _get_v1_reviews_bulk(self, forum_ids: List[str], year: int) -> Dict[str, List[Any]]:
         """
-        reviews = []
+        Fetch reviews for many papers at once (needed for 2016-2017)
         
+        Each invitation pattern is queried once as a regex across all papers
+        instead of once per paper, and the results are bucketed by forum.
+        
+        Args:
+            forum_ids: Forum IDs of the papers that need reviews
+            year: Conference year
+            
+        Returns:
+            Dictionary mapping forum ID to its list of review notes
+        """
         # Different invitation patterns by year
         if year == 2016:
             review_invitations = [
@@ -78,23 +455,63 @@ class OpenReviewClient:
             ]
         else:
             # 2018+ should have reviews in directReplies
-            return []
+            return {}
         
+        wanted = set(forum_ids)
+        reviews = defaultdict(list)
         for invitation_pattern in review_invitations:
             try:
-                # Replace * with actual forum ID
-                invitation = invitation_pattern.replace('*', forum_id)
-                notes = self.client_v1.get_all_notes(
-                    invitation=invitation,
-                    forum=forum_id
+                notes = self._retry(
+                    self.client_v1.get_all_notes,
+                    invitation=invitation_pattern.replace('*', '.*')
                 )
-                if notes:
-                    reviews.extend(notes)
             except:
                 continue
+            for note in notes or []:
+                if note.forum in wanted:
+                    reviews[note.forum].append(note)
         
         return reviews
     
+    def _get_v2_paginated(self, limit: int = 1000, **query) -> List[Any]:
+        """
+        Page through API v2 get_notes with replies attached
+        
+        Args:
+            limit: Page size (the API maximum is 1000)
+            **query: Filters passed to get_notes (invitation, content, ...)
+            
+        Returns:
+            Notes from all pages; pages fetched before an error are kept
+        """
+        offset = 0
+        submissions = []
+        
+        while True:
+            try:
+                # get_notes returns a plain list, so use it as-is
+                notes = self._retry(
+                    self.client_v2.get_notes,
+                    details='replies',
+                    limit=limit,
+                    offset=offset,
+                    **query
+                ) or []
+            except Exception as e:
+                print(f"      Pagination error: {str(e)[:100]}")
+                break
+            
+            if not notes:
+                break
+            submissions.extend(notes)
+            print(f"      Retrieved batch: {len(notes)} papers (total: {len(submissions)})")
+            
+            if len(notes) < limit:
+                break
+            offset += limit
+        
+        return submissions
+    
     def _get_v2_submissions(self, year: int) -> List[Any]:
         """
         Get submissions using API v2 for recent conferences
@@ -116,125 +533,44 @@ class OpenReviewClient:
         
         # Try different invitation patterns
         for invitation in invitation_patterns:
-            try:
-                print(f"    Trying invitation: {invitation}")
-                
-                # Try using get_notes with pagination instead of get_all_notes
-                offset = 0
-                limit = 1000
-                batch_submissions = []
-                
-                while True:
-                    try:
-                        # Use get_notes instead of get_all_notes for better control
-                        notes = self.client_v2.get_notes(
-                            invitation=invitation,
-                            details='replies',  # ADD THIS
-                            limit=limit,
-                            offset=offset
-                        )
-                        
-                        # Handle different response types
-                        if notes is None:
-                            break
-                        elif hasattr(notes, '__iter__'):
-                            # It's iterable
-                            notes_list = list(notes)
-                            if not notes_list:
-                                break
-                            batch_submissions.extend(notes_list)
-                            print(f"      Retrieved batch: {len(notes_list)} papers (total: {len(batch_submissions)})")
-                            
-                            if len(notes_list) < limit:
-                                break
-                            offset += limit
-                        else:
-                            # Single note or unexpected format
-                            break
-                            
-                        time.sleep(0.5)  # Rate limiting between batches
-                        
-                    except Exception as e:
-                        print(f"      Pagination error: {str(e)[:100]}")
-                        break
-                
-                if batch_submissions:
-                    all_submissions = batch_submissions
-                    print(f"    ✓ Found {len(all_submissions)} papers with invitation: {invitation}")
-                    break
-                    
-            except Exception as e:
-                print(f"    ✗ Failed with {invitation}: {str(e)[:100]}")
-                continue
+            print(f"    Trying invitation: {invitation}")
+            batch_submissions = self._get_v2_paginated(invitation=invitation)
+            if batch_submissions:
+                all_submissions = batch_submissions
+                print(f"    ✓ Found {len(all_submissions)} papers with invitation: {invitation}")
+                break
         
-        # If no results yet, try content-based query with better error handling
+        # If no results yet, try content-based query
         if not all_submissions:
-            try:
-                print(f"    Trying content venueid method...")
-                offset = 0
-                limit = 1000
-                batch_submissions = []
-                
-                while True:
-                    try:
-                        notes = self.client_v2.get_notes(
-                            content={'venueid': venue_id},
-                            details='replies',  # ADD THIS
-                            limit=limit,
-                            offset=offset
-                        )
-                        
-                        if notes is None:
-                            break
-                        elif hasattr(notes, '__iter__'):
-                            notes_list = list(notes)
-                            if not notes_list:
-                                break
-                            batch_submissions.extend(notes_list)
-                            print(f"      Retrieved batch: {len(notes_list)} papers (total: {len(batch_submissions)})")
-                            
-                            if len(notes_list) < limit:
-                                break
-                            offset += limit
-                        else:
-                            break
-                            
-                        time.sleep(0.5)
-                        
-                    except Exception as e:
-                        print(f"      Pagination error: {str(e)[:100]}")
-                        break
-                
-                if batch_submissions:
-                    all_submissions = batch_submissions
-                    print(f"    ✓ Found {len(all_submissions)} papers with venueid")
-                    
-            except Exception as e:
-                print(f"    ✗ venueid method failed: {str(e)[:100]}")
+            print(f"    Trying content venueid method...")
+            batch_submissions = self._get_v2_paginated(content={'venueid': venue_id})
+            if batch_submissions:
+                all_submissions = batch_submissions
+                print(f"    ✓ Found {len(all_submissions)} papers with venueid")
         
         # Process submissions and attach reviews
+        # Replies arrive with each page (details='replies'), so this loop makes
+        # no requests and needs no rate limiting
         if all_submissions:
             print(f"  Processing {len(all_submissions)} papers...")
             processed_submissions = []
-            
+
             for i, note in enumerate(all_submissions):
                 if i % 100 == 0 and i > 0:
                     print(f"    Processed {i}/{len(all_submissions)} papers")
-                
+
                 try:
                     # Create a wrapper object that mimics v1 structure
                     processed_note = self._create_v2_wrapper(note, year)
                     # The wrapper already has the replies, don't overwrite them!
-                    
+
                     processed_submissions.append(processed_note)
-                    
+
                 except Exception as e:
                     print(f"    Warning: Error processing paper {i}: {str(e)[:100]}")
                     # Skip this note entirely if we can't process it
                     continue
-                
-                time.sleep(0.02)  # Smaller delay for rate limiting
-            
+
             print(f"  ✓ Successfully processed {len(processed_submissions)} papers")
             return processed_submissions
 
@@ -252,53 +588,7 @@ class OpenReviewClient:
         Returns:
             Wrapped note object with normalized structure
         """
-        class NoteWrapper:
-            """Wrapper to normalize v2 notes"""
-            def __init__(self, v2_note, year):
-                # Safe attribute extraction with defaults
-                self.id = getattr(v2_note, 'id', '')
-                self.forum = getattr(v2_note, 'forum', '')
-                self.signatures = getattr(v2_note, 'signatures', [])
-                self.invitations = getattr(v2_note, 'invitations', [])
-                self.number = getattr(v2_note, 'number', None)
-                self.tcdate = getattr(v2_note, 'tcdate', None)
-                self.cdate = getattr(v2_note, 'cdate', None)
-                
-                # Normalize content - v2 has nested structure with 'value' keys
-                raw_content = getattr(v2_note, 'content', {})
-                self.content = self._normalize_content(raw_content)
-                
-                # Extract details including replies if present
-                if hasattr(v2_note, 'details'):
-                    self.details = v2_note.details
-                    # Make sure replies are accessible as both 'replies' and 'directReplies'
-                    if 'replies' in self.details:
-                        self.details['directReplies'] = self.details['replies']
-                else:
-                    self.details = {'replies': [], 'directReplies': []}
-            
-            def _normalize_content(self, v2_content: Dict) -> Dict:
-                """Extract values from v2 nested content structure"""
-                if not isinstance(v2_content, dict):
-                    return {}
-                    
-                normalized = {}
-                for key, value in v2_content.items():
-                    if isinstance(value, dict) and 'value' in value:
-                        normalized[key] = value['value']
-                    else:
-                        normalized[key] = value
-                return normalized
-        
-        return NoteWrapper(note, year)
-    
-    def _get_v2_reviews(self, forum_id: str, year: int) -> List[Any]:
-        reviews = []
-        
-        # Skip individual review fetching for large conferences
-        # Reviews should already be in the submission details
-        return []  # Let the submission's directReplies handle it
-
+        return NoteWrapper.from_v2(note)
     
     def _get_v1_submissions(self, year: int) -> List[Any]:
         """
@@ -346,7 +636,8 @@ class OpenReviewClient:
         for invitation in invitations:
             try:
                 print(f"    Trying API v1 invitation: {invitation}")
-                notes = self.client_v1.get_all_notes(
+                notes = self._retry(
+                    self.client_v1.get_all_notes,
                     invitation=invitation,
                     details='directReplies'
                 )
@@ -355,21 +646,21 @@ class OpenReviewClient:
                     print(f"    ✓ Found {len(notes)} papers with this invitation")
                     all_submissions.extend(notes)
                     # For recent years, stop after finding sufficient results
-                    if year >= 2023 and len(all_submissions) > 100:
+                    if year >= 2023 and len(all_submissions) >= self._FALLBACK_MIN:
                         break
                     
             except Exception as e:
-                error_msg = str(e)[:100] if len(str(e)) > 100 else str(e)
                 # Only print if it's not a 404 (expected for non-existent invitations)
-                if '404' not in error_msg:
-                    print(f"    ✗ Failed with {invitation}: {error_msg}")
+                if _status_of(e) != 404:
+                    print(f"    ✗ Failed with {invitation}: {str(e)[:100]}")
                 continue
         
         # Try venueid approach if no results
         if not all_submissions:
             try:
                 print(f"    Trying content.venueid with API v1")
-                notes = self.client_v1.get_all_notes(
+                notes = self._retry(
+                    self.client_v1.get_all_notes,
                     content={'venueid': f'ICLR.cc/{year}/Conference'},
                     details='directReplies'
                 )
@@ -378,14 +669,15 @@ class OpenReviewClient:
                     all_submissions.extend(notes)
             except Exception as e:
                 # Only print non-404 errors
-                if '404' not in str(e):
+                if _status_of(e) != 404:
                     print(f"    ✗ venueid failed: {str(e)[:50]}")
         
         # For 2024/2025, also try without '/Conference' suffix
         if not all_submissions and year >= 2024:
             try:
                 print(f"    Trying simplified venueid: ICLR.cc/{year}")
-                notes = self.client_v1.get_all_notes(
+                notes = self._retry(
+                    self.client_v1.get_all_notes,
                     content={'venueid': f'ICLR.cc/{year}'},
                     details='directReplies'
                 )
@@ -395,29 +687,24 @@ class OpenReviewClient:
             except:
                 pass
         
-        # Remove duplicates
-        seen = set()
-        unique_submissions = []
-        for note in all_submissions:
-            if note.id not in seen:
-                seen.add(note.id)
-                unique_submissions.append(note)
+        # Remove duplicates (dicts keep first-seen order)
+        unique_submissions = list({note.id: note for note in all_submissions}.values())
         
         if unique_submissions:
             print(f"  ✓ Total unique papers found with API v1: {len(unique_submissions)}")
 
         # For 2016-2017, manually fetch and attach reviews
         if year <= 2016 and unique_submissions:
-            print(f"  Fetching reviews separately for {year}...")
-            for submission in tqdm(unique_submissions[:10], desc="Adding reviews"):
-                if not hasattr(submission, 'details') or not submission.details.get('directReplies'):
-                    reviews = self._get_v1_reviews_separately(submission.id, year)  # Now this will work
-                    if not hasattr(submission, 'details'):
+            missing = [
+                submission for submission in unique_submissions
+                if not getattr(submission, 'details', None) or not submission.details.get('directReplies')
+            ]
+            if missing:
+                print(f"  Fetching reviews separately for {year}...")
+                reviews = self._get_v1_reviews_bulk([submission.id for submission in missing], year)
+                for submission in missing:
+                    if not getattr(submission, 'details', None):
                         submission.details = {}
-                    submission.details['directReplies'] = reviews
+                    submission.details['directReplies'] = reviews.get(submission.id, [])
         
         return unique_submissions
-    
-    def add_delay(self, seconds: float = 0.1):
-        """Add delay for rate limiting"""
-        time.sleep(seconds)
\ No newline at end of file
@@ -1,9 +1,11 @@
 """
 Main orchestrator for ICLR data collection
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from tqdm import tqdm
-import time
-from typing import List, Dict
+from typing import List, Dict, Set
 from .api_client import OpenReviewClient
 from .processor import PaperProcessor
 from .storage import Storage
@@ -11,28 +13,37 @@ from .storage import Storage
 class ICLRCollector:
     """Orchestrate the collection of ICLR papers"""
     
-    def __init__(self, username: str = None, password: str = None):
+    # Papers buffered in memory before each write to storage
+    SAVE_BATCH_SIZE = 128
+    
+    def __init__(self, username: str = None, password: str = None, build_workers: int = None):
         """
         Initialize collector with API client, processor, and storage
         
         Args:
             username: OpenReview username (optional)
             password: OpenReview password (optional)
+            build_workers: If set, build paper records in this many processes
         """
+        self.build_workers = build_workers
+        # One build pool shared by every year, created on first use
+        self._build_pool = None
+        self._build_pool_lock = threading.Lock()
         self.client = OpenReviewClient(username, password)
         self.processor = PaperProcessor()
         self.storage = Storage()
     
-    def collect_year(self, year: int, append_mode: bool = True) -> List[Dict]:
+    def collect_year(self, year: int, append_mode: bool = True, skip_ids: Set[str] = None) -> List[Dict]:
         """
         Collect all papers for a specific year
         
         Args:
             year: Conference year to collect
             append_mode: If True, append to existing file. If False, clear file first.
+            skip_ids: Paper IDs already stored (e.g. when resuming); these are not rebuilt
             
         Returns:
-            List of collected paper dictionaries
+            List of newly collected paper dictionaries
         """
         print(f"\n📚 Collecting ICLR {year}...")
         
@@ -45,34 +56,103 @@ class ICLRCollector:
         
         print(f"📄 Found {len(submissions)} papers")
         
-        # Process each paper
+        if skip_ids:
+            submissions = [s for s in submissions if getattr(s, 'id', None) not in skip_ids]
+            print(f"⏭️  {len(submissions)} papers not yet collected")
+        
+        if self.build_workers:
+            return self._build_year_parallel(submissions, year)
+        
+        # Process each paper; one crawl timestamp covers the whole year
+        crawl_timestamp = datetime.now().isoformat()
+        papers = []
+        pending = []
+        try:
+            for submission in tqdm(submissions, desc=f"Processing {year}",
+                                   miniters=100, mininterval=1.0, smoothing=0.1):
+                try:
+                    # Build paper record
+                    paper = self.processor.build_paper_record(submission, year, crawl_timestamp)
+                    
+                    # Save in batches (incremental save)
+                    pending.append(paper)
+                    if len(pending) >= self.SAVE_BATCH_SIZE:
+                        self.storage.save_papers(pending)
+                        pending = []
+                    papers.append(paper)
+                    
+                except Exception as e:
+                    print(f"\n⚠️  Error processing paper: {e}")
+                    continue
+        finally:
+            # Write the rest of the year out even if interrupted
+            self.storage.save_papers(pending)
+            self.storage.flush()
+        
+        self.storage.mark_year_complete(year)
+        print(f"✅ Collected {len(papers)} papers from ICLR {year}")
+        return papers
+    
+    def _get_build_pool(self):
+        """Return the shared build pool, creating it on first use"""
+        with self._build_pool_lock:
+            if self._build_pool is None:
+                self._build_pool = self.processor.make_build_pool(self.build_workers)
+            return self._build_pool
+    
+    def close(self):
+        """Shut down the shared build pool, if one was started"""
+        with self._build_pool_lock:
+            pool, self._build_pool = self._build_pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    
+    def _build_year_parallel(self, submissions: List, year: int) -> List[Dict]:
+        """
+        Build a year's paper records in worker processes, then save them
+        
+        Extraction runs in parallel, in one pool of build_workers processes
+        shared by concurrent years; writes stay sequential through storage,
+        in batches as records arrive.
+        
+        Args:
+            submissions: Submissions to process
+            year: Conference year
+            
+        Returns:
+            List of newly collected paper dictionaries
+        """
         papers = []
-        for submission in tqdm(submissions, desc=f"Processing {year}"):
-            try:
-                # Build paper record
-                paper = self.processor.build_paper_record(submission, year)
-                
-                # Save immediately (incremental save)
-                self.storage.save_paper(paper)
+        pending = []
+        try:
+            build = self.processor.iter_build_many(submissions, year, executor=self._get_build_pool())
+            for paper in tqdm(build, total=len(submissions), desc=f"Processing {year}",
+                              miniters=100, mininterval=1.0, smoothing=0.1):
+                pending.append(paper)
+                if len(pending) >= self.SAVE_BATCH_SIZE:
+                    self.storage.save_papers(pending)
+                    pending = []
                 papers.append(paper)
-                
-                # Rate limiting
-                self.client.add_delay(0.1)
-                
-            except Exception as e:
-                print(f"\n⚠️  Error processing paper: {e}")
-                continue
+        finally:
+            # Write the rest of the year out even if interrupted
+            self.storage.save_papers(pending)
+            self.storage.flush()
         
+        self.storage.mark_year_complete(year)
         print(f"✅ Collected {len(papers)} papers from ICLR {year}")
         return papers
     
-    def collect_all(self, start_year: int = 2016, end_year: int = 2025):
+    def collect_all(self, start_year: int = 2016, end_year: int = 2025, max_workers: int = 4):
         """
         Collect papers for all years in range
         
+        Years are collected concurrently; request pacing is shared through
+        the API client's rate limiters.
+        
         Args:
             start_year: First year to collect
             end_year: Last year to collect
+            max_workers: Number of years collected at the same time
         """
         print(f"🚀 Starting ICLR data collection ({start_year}-{end_year})")
         print("=" * 50)
@@ -82,31 +162,38 @@ class ICLRCollector:
         
         # Collect each year
         summary = {}
-        for year in range(start_year, end_year + 1):
-            try:
-                papers = self.collect_year(year, append_mode=True)
-                summary[year] = {
-                    'success': True,
-                    'count': len(papers)
-                }
-                
-                # Delay between years to be respectful
-                if year < end_year:
-                    print("⏳ Waiting before next year...")
-                    time.sleep(5)
-                    
-            except Exception as e:
-                print(f"❌ Failed to collect {year}: {e}")
-                summary[year] = {
-                    'success': False,
-                    'error': str(e)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.collect_year, year, True): year
+                    for year in range(start_year, end_year + 1)
                 }
+                for future in as_completed(futures):
+                    year = futures[future]
+                    try:
+                        papers = future.result()
+                        summary[year] = {
+                            'success': True,
+                            'count': len(papers)
+                        }
+                        
+                    except Exception as e:
+                        print(f"❌ Failed to collect {year}: {e}")
+                        summary[year] = {
+                            'success': False,
+                            'error': str(e)
+                        }
+        finally:
+            self.close()
         
         # Print final summary
         self._print_summary(summary)
         
         # Generate README
         self._generate_readme()
+        
+        # Columnar copy of the reviews, when pyarrow is installed
+        self._export_arrow()
     
     def _print_summary(self, summary: Dict):
         """Print collection summary"""
@@ -125,6 +212,19 @@ class ICLRCollector:
         print(f"\n📈 Total papers collected: {total}")
         print(f"📁 Data saved to: {self.storage.output_file}")
     
+    def _export_arrow(self):
+        """Write the Arrow review table alongside the JSONL file (optional)"""
+        try:
+            arrow_file = self.storage.save_arrow()
+        except ImportError:
+            print("ℹ️  pyarrow not installed, skipping Arrow export")
+            return
+        except Exception as e:
+            # The JSONL file is complete; don't fail the crawl over the copy
+            print(f"⚠️  Arrow export failed: {e}")
+            return
+        print(f"🏹 Reviews exported to: {arrow_file}")
+    
     def _generate_readme(self):
         """Generate README with dataset documentation"""
         stats = self.storage.get_statistics()
@@ -1,562 +1,874 @@
 """
 Process and extract data from OpenReview submissions
 """
+import io
+import multiprocessing
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache, partial
+from sys import intern
+from typing import Dict, List, Any, Optional, Tuple
 
-class PaperProcessor:
-    """Extract and process paper data from API responses"""
+
+# Invitation categories, combined as bits by _classify_invitation
+_REVIEW = 1 << 0        # official reviews and comments
+_EXCLUDED = 1 << 1      # meta-reviews, decisions, rebuttals and withdrawals
+_META_REVIEW = 1 << 2   # meta-reviews and decision notes
+_REVIEW_2017 = 1 << 3   # looser review/comment naming used in 2017
+_PAPER = 1 << 4
+_WORKSHOP = 1 << 5
+_DECISION = 1 << 6      # prefilter for the case-sensitive 'Decision' check
+
+# Replies with none of these bits can't contribute a review, meta-review,
+# decision or workshop flag
+_ROUTED = _REVIEW_2017 | _META_REVIEW | _DECISION | _WORKSHOP
+
+# Patterns per category (matched against the lowercased invitation)
+_INVITATION_PATTERNS = {
+    _REVIEW: (
+        'official_review',
+        'official_comment',
+        '/review',
+        '/comment',
+        'public_comment'
+    ),
+    _EXCLUDED: (
+        'meta_review',
+        'metareview',
+        'decision',
+        'accept',
+        'reject',
+        'withdraw',
+        'desk_reject',
+        'author_rebuttal',
+        'response',
+        'authors'
+    ),
+    _META_REVIEW: (
+        'meta_review',
+        'metareview',
+        'meta-review',
+        'decision',
+        'accept',
+        'reject',
+        'poster',
+        'spotlight',
+        'oral'
+    ),
+    _REVIEW_2017: ('review', 'comment'),
+    _PAPER: ('paper',),
+    _WORKSHOP: ('workshop',),
+    _DECISION: ('decision',)
+}
+
+
+def _build_invitation_classifier(patterns_by_bit: Dict[int, Tuple[str, ...]]) -> Tuple[re.Pattern, Dict[str, int]]:
+    """
+    Compile all category patterns into one regex plus a pattern -> bits table
     
-    @staticmethod
-    def extract_content(content: Dict, is_v2: bool = False) -> Dict:
-        """
-        Extract content from API response
-        API v2 wraps values in {value: ...} objects
-        
-        Args:
-            content: Raw content from API
-            is_v2: Whether this is from API v2
-            
-        Returns:
-            Extracted content dictionary
-        """
-        if is_v2 and isinstance(content, dict):
-            extracted = {}
-            for key, value in content.items():
-                if isinstance(value, dict) and 'value' in value:
-                    extracted[key] = value['value']
-                else:
-                    extracted[key] = value
-            return extracted
-        return content
+    The pattern sits inside a lookahead so finditer reports overlapping
+    matches (e.g. 'reject' inside 'desk_reject'). At any one position only the
+    longest alternative is reported, so each pattern's bits also include those
+    of the patterns it starts with.
+    """
+    bits = {}
+    for bit, patterns in patterns_by_bit.items():
+        for pattern in patterns:
+            bits[pattern] = bits.get(pattern, 0) | bit
     
-    @staticmethod
-    def extract_reviews(replies: List[Any]) -> List[Dict]:
-        """
-        Extract official reviews from replies
-        
-        Args:
-            replies: List of reply objects
-            
-        Returns:
-            List of processed review dictionaries
-        """
-        reviews = []
-        
-        for reply in replies:
-            # Handle both raw dicts and objects
-            if hasattr(reply, '__dict__'):
-                # Object with attributes (API v1)
-                invitations = getattr(reply, 'invitations', [])
-                invitation = getattr(reply, 'invitation', '') or ' '.join(str(inv) for inv in invitations)
-                content = getattr(reply, 'content', {})
-                signatures = getattr(reply, 'signatures', ['Anonymous'])
-                tcdate = getattr(reply, 'tcdate', None)
-                cdate = getattr(reply, 'cdate', None)
+    masks = {}
+    for pattern in bits:
+        mask = 0
+        for other, other_bits in bits.items():
+            if pattern.startswith(other):
+                mask |= other_bits
+        masks[pattern] = mask
+    
+    alternation = '|'.join(re.escape(p) for p in sorted(bits, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))'), masks
+
+
+_INVITATION_RE, _INVITATION_MASKS = _build_invitation_classifier(_INVITATION_PATTERNS)
+
+
+@lru_cache(maxsize=8192)
+def _classify_invitation(invitation: str) -> int:
+    """
+    Return the category bits of an invitation in one regex pass
+    
+    Replies of a paper (and papers of a year, for shared invitations) repeat
+    the same invitation strings, so results are memoized on the raw string.
+    """
+    bits = 0
+    for match in _INVITATION_RE.finditer(invitation.lower()):
+        bits |= _INVITATION_MASKS[match.group(1)]
+    return bits
+
+# Opening phrases of author responses posted under review invitations:
+# 'thank all reviewers', 'we thank', 'we appreciate', 'we have revised' and
+# 'we have updated', factored so the shared 'we ' prefix is matched once
+_AUTHOR_RESPONSE_RE = re.compile(
+    r'thank all reviewers|we (?:thank|appreciate|have (?:revised|updated))'
+)
+
+# Review fields whose opening text is checked for author response phrases
+_AUTHOR_TEXT_FIELDS = ('summary_of_the_review', 'summary_of_the_paper', 'comment', 'review')
+
+# Other fields that might contain review content, with their section labels
+_EXTRA_REVIEW_FIELDS = tuple(
+    (name, name.replace('_', ' ').title())
+    for name in ('detailed_comments', 'general_comments',
+                 'technical_quality', 'clarity', 'originality',
+                 'significance', 'pros', 'cons')
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ContentFields:
+    """Content field names of one API format, each tried in order (first non-empty wins)"""
+    rating: Tuple[str, ...]
+    review_text: Tuple[str, ...]
+    questions: Tuple[str, ...]
+    summary: Tuple[str, ...]
+    meta_review: Tuple[str, ...]
+    recommendation: Tuple[str, ...]
+    combined_strengths: bool    # accept '(strength|strengths)_and_weaknesses'
+    meta_review_2023: bool      # fall back to the split 2023 meta-review fields
+    first_present: bool         # rating/review_text take the first field present, even if empty
+
+
+_V1_FIELDS = _ContentFields(
+    rating=('rating', 'recommendation', 'score'),
+    review_text=(
+        'review',
+        'text',
+        'comment',
+        'main_review',
+        'summary_of_contributions',
+        'summary_of_the_review',  # 2023 style
+        'summary_of_the_paper'  # 2023 style
+    ),
+    questions=(
+        'questions',
+        'clarity,_quality,_novelty_and_reproducibility',  # 2023
+        'additional_comments',
+        'comments'
+    ),
+    summary=(
+        'summary',
+        'summary_of_the_paper',  # 2023
+        'summary_of_the_review',  # 2023
+        'brief_summary'
+    ),
+    meta_review=(
+        'metareview',
+        'meta_review',
+        'comment',
+        'decision_comment',
+        'justification',
+        'acceptance_decision',
+        'program_chair_comment',
+        'area_chair_comment'
+    ),
+    recommendation=('recommendation', 'decision'),
+    combined_strengths=True,
+    meta_review_2023=True,
+    first_present=False
+)
+
+_V2_FIELDS = _ContentFields(
+    rating=('rating', 'recommendation'),
+    review_text=('review', 'comment', 'text'),
+    questions=('questions',),
+    summary=('summary',),
+    meta_review=('metareview', 'meta_review', 'comment', 'decision', 'justification'),
+    recommendation=('recommendation', 'decision'),
+    combined_strengths=False,
+    meta_review_2023=False,
+    # v2 reviews always carried their own (possibly empty) rating/review field
+    first_present=True
+)
+
+# Indexed by is_v2
+_CONTENT_FIELDS = {False: _V1_FIELDS, True: _V2_FIELDS}
+
+
+def _first(content: Dict, fields: Tuple[str, ...], default: Any = '') -> Any:
+    """Return the first non-empty value among fields, or default"""
+    for field in fields:
+        value = content.get(field)
+        if value:
+            return value
+    return default
+
+
+def _first_present(content: Dict, fields: Tuple[str, ...], default: Any = '') -> Any:
+    """Return the value of the first field present (even if empty), or default"""
+    for field in fields:
+        if field in content:
+            return content[field]
+    return default
+
+
+@dataclass(slots=True)
+class Review:
+    """One official review; serialized by orjson with the same keys as the old dict"""
+    reviewer_id: str
+    score: Any
+    confidence: Any
+    text: str
+    date: str
+    strengths: Any
+    weaknesses: Any
+    questions: Any
+    summary: Any
+
+
+@dataclass(slots=True)
+class NormalizedReply:
+    """A reply from either API, normalized once before extraction"""
+    invitation: str
+    bits: int       # category bits from _classify_invitation
+    content: Any    # v2 {'value': ...} wrappers already unwrapped
+    signatures: Any
+    tcdate: Any
+    cdate: Any
+
+
+@dataclass(slots=True)
+class MetaReview:
+    """Area chair meta-review text and recommendation"""
+    text: Any = ''
+    decision_rationale: Any = ''
+
+
+# Decision keywords in priority order. Each alternative is an anchored lookahead,
+# so one match() finds the highest-priority keyword anywhere in the string and
+# lastindex tells which one it was.
+_DECISION_KEYWORDS = ('accept', 'reject', 'poster', 'oral', 'spotlight')
+_DECISION_RE = re.compile(
+    '|'.join(f'(?=.*?({keyword}))' for keyword in _DECISION_KEYWORDS),
+    re.DOTALL
+)
+
+_fromtimestamp = datetime.fromtimestamp
+_localtime = time.localtime
+
+
+@lru_cache(maxsize=65536)
+def _iso_from_ms(timestamp_ms: float) -> str:
+    """
+    Format an OpenReview millisecond timestamp as a local ISO string (memoized)
+    
+    Integer timestamps are formatted from time.localtime directly, giving the
+    same text as datetime.fromtimestamp(ms / 1000).isoformat() without
+    building a datetime.
+    """
+    if type(timestamp_ms) is not int:
+        return _fromtimestamp(timestamp_ms / 1000).isoformat()
+    
+    seconds, millis = divmod(timestamp_ms, 1000)
+    t = _localtime(seconds)
+    iso = (
+        f'{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}'
+        f'T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}'
+    )
+    # isoformat() only shows microseconds when there are any
+    return f'{iso}.{millis:03d}000' if millis else iso
+
+
+def _intern(value: Any) -> Any:
+    """Intern repeated categorical strings (reviewer ids, score labels); other values pass through"""
+    return intern(value) if type(value) is str else value
+
+
+def _detect_v2(replies: List[Any]) -> bool:
+    """
+    Tell whether a paper's replies use the API v2 {'value': ...} content format
+    
+    All replies of a paper come from the same API, so the first reply with
+    non-empty content decides. Submission content can't be used for this
+    because NoteWrapper has already flattened it.
+    """
+    for reply in replies:
+        if isinstance(reply, dict):
+            content = reply.get('content')
+        else:
+            content = getattr(reply, 'content', None)
+        if isinstance(content, dict) and content:
+            return any(isinstance(v, dict) and 'value' in v for v in content.values())
+    return False
+
+
+def extract_content(content: Dict, is_v2: bool = False) -> Dict:
+    """
+    Extract content from API response
+    API v2 wraps values in {value: ...} objects
+
+    Args:
+        content: Raw content from API
+        is_v2: Whether this is from API v2
+
+    Returns:
+        Extracted content dictionary
+    """
+    if is_v2 and isinstance(content, dict):
+        extracted = {}
+        for key, value in content.items():
+            if isinstance(value, dict) and 'value' in value:
+                extracted[key] = value['value']
             else:
-                # Dictionary (API v2 - 2024+)
-                invitations = reply.get('invitations', [])
-                # Safely handle invitations that might be dicts, strings, or mixed
-                invitation_parts = []
-                for inv in invitations:
-                    if isinstance(inv, dict):
-                        invitation_parts.append(inv.get('id', inv.get('name', str(inv))))
-                    elif isinstance(inv, str):
-                        invitation_parts.append(inv)
-                    else:
-                        invitation_parts.append(str(inv))
-                
-                invitation = ' '.join(invitation_parts) if invitation_parts else reply.get('invitation', '')
-                
-                content = reply.get('content', {})
-                signatures = reply.get('signatures', ['Anonymous'])
-                tcdate = reply.get('tcdate')
-                cdate = reply.get('cdate')
-            
-            # Convert invitation to lowercase for matching
-            invitation_lower = invitation.lower()
-            
-            # Check if this is a review (not meta-review or decision)
-            is_review = any(pattern in invitation_lower for pattern in [
-                'official_review',
-                'official_comment',
-                '/review',
-                '/comment',
-                'public_comment'
-            ])
-            
-            # Exclude meta-reviews, decisions, and other non-review content
-            is_excluded = any(pattern in invitation_lower for pattern in [
-                'meta_review',
-                'metareview', 
-                'decision',
-                'accept',
-                'reject',
-                'withdraw',
-                'desk_reject',
-                'author_rebuttal',
-                'response',
-                'authors'
-            ])
-
-            # Also check the content to filter out author responses
-            if is_review and not is_excluded:
-                # Additional check: if it's from authors, skip it
-                if signatures and any('Author' in str(sig) for sig in signatures):
-                    continue  # Skip author responses
-                
-                # Check content for author response patterns
-                if isinstance(content, dict):
-                    # Safely extract text from fields that might be dicts or strings
-                    text_parts = []
-                    for field in ['summary_of_the_review', 'summary_of_the_paper', 'comment', 'review']:
-                        field_value = content.get(field, '')
-                        if isinstance(field_value, dict):
-                            # If it's a dict, try to get the 'value' key
-                            text_parts.append(str(field_value.get('value', '')))
-                        else:
-                            # If it's already a string or other type
-                            text_parts.append(str(field_value))
-                    
-                    text_to_check = ' '.join(text_parts)[:200].lower()
-                    
-                    if any(phrase in text_to_check for phrase in [
-                        'thank all reviewers',
-                        'we thank',
-                        'we appreciate',
-                        'we have revised',
-                        'we have updated'
-                    ]):
-                        continue 
-            
-            # For 2017 specifically
-            if not is_review and '2017' in invitation:
-                is_review = 'paper' in invitation_lower and any(
-                    pattern in invitation_lower for pattern in ['review', 'comment']
-                )
-            
-            if is_review and not is_excluded:
-                # Extract values from content
-                if isinstance(content, dict):
-                    # Check if it's v2 format (nested with 'value' keys)
-                    is_v2_format = any(
-                        isinstance(v, dict) and 'value' in v 
-                        for v in content.values()
-                    )
-                    
-                    if is_v2_format:
-                        # v2 format - extract from nested structure
-                        rating = (
-                            content.get('rating', {}).get('value') if 'rating' in content 
-                            else content.get('recommendation', {}).get('value', '')
-                        )
-                        confidence = content.get('confidence', {}).get('value', '')
-                        review_text = (
-                            content.get('review', {}).get('value') if 'review' in content 
-                            else content.get('comment', {}).get('value') if 'comment' in content
-                            else content.get('text', {}).get('value', '')  # Also check 'text' field
-                        )
-                        strengths = content.get('strengths', {}).get('value', '')
-                        weaknesses = content.get('weaknesses', {}).get('value', '')
-                        questions = content.get('questions', {}).get('value', '')
-                        summary = content.get('summary', {}).get('value', '')
-                    else:
-                        # v1 format - direct access
-                        # Try all possible field names for rating
-                        rating = (
-                            content.get('rating') or 
-                            content.get('recommendation') or
-                            content.get('score', '')
-                        )
-                        
-                        confidence = content.get('confidence', '')
-                        
-                        # Try all possible field names for review text
-                        review_text = (
-                            content.get('review') or 
-                            content.get('text') or  # Also check 'text' field
-                            content.get('comment') or 
-                            content.get('main_review') or
-                            content.get('summary_of_contributions') or
-                            content.get('summary_of_the_review') or  # 2023 style
-                            content.get('summary_of_the_paper', '')  # 2023 style
-                        )
-                        
-                        # Handle various strength/weakness formats
-                        if 'strength_and_weaknesses' in content:
-                            # Combined field (2023 and possibly others)
-                            combined = content['strength_and_weaknesses']
-                            strengths = combined
-                            weaknesses = ''  # Combined with strengths
-                        elif 'strengths_and_weaknesses' in content:
-                            # Alternative spelling
-                            combined = content['strengths_and_weaknesses']
-                            strengths = combined
-                            weaknesses = ''
-                        else:
-                            # Separate fields (most years)
-                            strengths = content.get('strengths', '')
-                            weaknesses = content.get('weaknesses', '')
-                        
-                        # Try various question/comment field names
-                        questions = (
-                            content.get('questions') or
-                            content.get('clarity,_quality,_novelty_and_reproducibility') or  # 2023
-                            content.get('additional_comments') or
-                            content.get('comments', '')
-                        )
-                        
-                        # Try various summary field names
-                        summary = (
-                            content.get('summary') or
-                            content.get('summary_of_the_paper') or  # 2023
-                            content.get('summary_of_the_review') or  # 2023
-                            content.get('brief_summary', '')
-                        )
-                    
-                    # If review_text is empty but we have other components, combine them
-                    # This is especially important for 2024 where text field is often empty
-                    if not review_text and (summary or strengths or weaknesses or questions):
-                        parts = []
-                        
-                        # Add summary first as it's usually the overview
-                        if summary:
-                            parts.append(f"**Summary:**\n{summary}")
-                        
-                        # Add strengths
-                        if strengths:
-                            parts.append(f"**Strengths:**\n{strengths}")
-                        
-                        # Add weaknesses
-                        if weaknesses:
-                            parts.append(f"**Weaknesses:**\n{weaknesses}")
-                        
-                        # Add questions/additional comments
-                        if questions:
-                            parts.append(f"**Questions/Comments:**\n{questions}")
-                        
-                        # Add any other fields that might contain review content
-                        for field_name in ['detailed_comments', 'general_comments', 
-                                        'technical_quality', 'clarity', 'originality', 
-                                        'significance', 'pros', 'cons']:
-                            if field_name in content:
-                                field_value = content[field_name]
-                                # Handle if the field is also a dict with 'value' (v2 format)
-                                if isinstance(field_value, dict) and 'value' in field_value:
-                                    field_value = field_value['value']
-                                if field_value:
-                                    field_label = field_name.replace('_', ' ').title()
-                                    parts.append(f"**{field_label}:**\n{field_value}")
-                        
-                        review_text = '\n\n'.join(parts)
-                    
-                else:
-                    rating = ''
-                    confidence = ''
-                    review_text = ''
-                    strengths = ''
-                    weaknesses = ''
-                    questions = ''
-                    summary = ''
-                
-                # Only add if there's actual review content
-                if review_text or summary or strengths or weaknesses:
-                    review = {
-                        'reviewer_id': signatures[0] if signatures else 'Anonymous',
-                        'score': rating,
-                        'confidence': confidence,
-                        'text': review_text,  # This now contains the combined text
-                        'date': '',
-                        'strengths': strengths,  # Keep individual fields too
-                        'weaknesses': weaknesses,
-                        'questions': questions,
-                        'summary': summary
-                    }
-
-                    # Filter out author responses before adding
-                    if 'Authors' in review['reviewer_id']:
-                        continue  # Skip author responses
-                    
-                    # Format date if available
-                    if tcdate:
-                        review['date'] = datetime.fromtimestamp(
-                            tcdate / 1000
-                        ).isoformat()
-                    elif cdate:
-                        review['date'] = datetime.fromtimestamp(
-                            cdate / 1000  
-                        ).isoformat()
-                    
-                    reviews.append(review)
-        
-        return reviews
-
-    @staticmethod
-    def extract_meta_review(replies: List[Any], year: int = None) -> Dict:
-        """
-        Extract meta-review from replies
-        
-        Args:
-            replies: List of reply objects
-            year: Conference year (optional, for year-specific handling)
-            
-        Returns:
-            Meta-review dictionary
-        """
+                extracted[key] = value
+        return extracted
+    return content
+
+
+def _iter_replies(replies: List[Any], is_v2: bool):
+    """
+    Normalize replies from both API versions in one place
+
+    Args:
+        replies: List of reply objects (API v1) or dicts (API v2)
+        is_v2: Whether replies use v2 content, which is flattened here
+
+    Yields:
+        NormalizedReply for each reply that any extractor can use; the rest
+        (rebuttals, withdrawals, ...) are dropped before their content is copied
+    """
+    if not replies:
+        return
+
+    # Module-level lookups hoisted out of the per-reply loops
+    classify = _classify_invitation
+    flatten = extract_content
+    make_reply = NormalizedReply
+
+    # A reply list comes from a single API, so pick the accessor once
+    if not isinstance(replies[0], dict):
+        # Objects with attributes (API v1)
         for reply in replies:
-            # Handle both objects and dicts
-            if hasattr(reply, '__dict__'):
-                # Object with attributes (API v1)
-                invitations = getattr(reply, 'invitations', [])
-                invitation = getattr(reply, 'invitation', '') or ' '.join(str(inv) for inv in invitations)
-                content = getattr(reply, 'content', {})
-            else:
-                # Dictionary (API v2 - 2024+)
-                invitations = reply.get('invitations', [])
-                # Safely handle invitations that might be dicts, strings, or mixed
-                invitation_parts = []
-                for inv in invitations:
-                    if isinstance(inv, dict):
-                        invitation_parts.append(inv.get('id', inv.get('name', str(inv))))
-                    elif isinstance(inv, str):
-                        invitation_parts.append(inv)
-                    else:
-                        invitation_parts.append(str(inv))
-                
-                invitation = ' '.join(invitation_parts) if invitation_parts else reply.get('invitation', '')
-                
-                content = reply.get('content', {})
-            
-            # Convert to lowercase for matching
-            invitation_lower = invitation.lower()
-            
-            # Check for meta-review patterns
-            is_meta_review = any(pattern in invitation_lower for pattern in [
-                'meta_review', 
-                'metareview', 
-                'meta-review',
-                'decision',
-                'accept',
-                'reject',
-                'poster',
-                'spotlight',
-                'oral'
-            ])
-            
-            if is_meta_review:
-                # Check format and extract accordingly
-                if isinstance(content, dict):
-                    is_v2_format = any(isinstance(v, dict) and 'value' in v for v in content.values())
-                    
-                    if is_v2_format:
-                        # v2 format - nested structure
-                        metareview_text = (
-                            content.get('metareview', {}).get('value') or
-                            content.get('meta_review', {}).get('value') or
-                            content.get('comment', {}).get('value') or
-                            content.get('decision', {}).get('value') or
-                            content.get('justification', {}).get('value', '')
-                        )
-                        recommendation = (
-                            content.get('recommendation', {}).get('value') or
-                            content.get('decision', {}).get('value', '')
-                        )
-                    else:
-                        # v1 format - direct access
-                        # Try MANY field names used across different years
-                        metareview_text = (
-                            content.get('metareview') or 
-                            content.get('meta_review') or
-                            content.get('comment') or
-                            content.get('decision_comment') or
-                            content.get('justification') or
-                            content.get('acceptance_decision') or
-                            content.get('program_chair_comment') or
-                            content.get('area_chair_comment', '')
-                        )
-                        
-                        # For 2023, check the special field names
-                        if not metareview_text or len(metareview_text) < 50:
-                            # Try 2023-specific fields
-                            meta_summary = content.get('metareview:_summary,_strengths_and_weaknesses', '')
-                            higher_just = content.get('justification_for_why_not_higher_score', '')
-                            lower_just = content.get('justification_for_why_not_lower_score', '')
-                            
-                            # Combine available 2023 fields
-                            parts = []
-                            if meta_summary:
-                                parts.append(meta_summary)
-                            if higher_just:
-                                parts.append(f"Why not higher: {higher_just}")
-                            if lower_just:
-                                parts.append(f"Why not lower: {lower_just}")
-                            
-                            if parts:
-                                metareview_text = '\n\n'.join(parts)
-                        
-                        recommendation = (
-                            content.get('recommendation') or
-                            content.get('decision', '')
-                        )
-                else:
-                    metareview_text = ''
-                    recommendation = ''
-                
-                # Return if we found content
-                if metareview_text or recommendation:
-                    return {
-                        'text': metareview_text,
-                        'decision_rationale': recommendation
-                    }
-        
-        # No meta-review found
-        return {'text': '', 'decision_rationale': ''}
-          
-    @staticmethod
-    def extract_decision(replies: List[Any]) -> str:
-        """
-        Extract acceptance decision from replies
-        
-        Args:
-            replies: List of reply objects
-            
-        Returns:
-            Decision string (accept/reject/workshop_paper)
-        """
-        # Check if any reply indicates this is a workshop paper
-        is_workshop = False
-        
+            invitation = getattr(reply, 'invitation', None)
+            if not invitation:
+                # Only join the invitations list when there is no single invitation
+                invitations = getattr(reply, 'invitations', None)
+                invitation = ' '.join(str(inv) for inv in invitations) if invitations else ''
+            bits = classify(invitation)
+            if not bits & _ROUTED:
+                continue
+            yield make_reply(
+                invitation,
+                bits,
+                flatten(getattr(reply, 'content', {}), is_v2),
+                getattr(reply, 'signatures', ['Anonymous']),
+                getattr(reply, 'tcdate', None),
+                getattr(reply, 'cdate', None)
+            )
+    else:
+        # Dictionaries (API v2 - 2024+)
         for reply in replies:
-            # Handle both objects and dicts
-            if hasattr(reply, '__dict__'):
-                invitations = getattr(reply, 'invitations', [])
-                invitation = getattr(reply, 'invitation', '') or ' '.join(str(inv) for inv in invitations)
-                content = getattr(reply, 'content', {})
+            invitations = reply.get('invitations')
+            if invitations:
+                try:
+                    # Fast path: invitations are almost always plain strings
+                    invitation = ' '.join(invitations)
+                except TypeError:
+                    # Safely handle invitations that might be dicts, strings, or mixed
+                    invitation = ' '.join(
+                        inv if isinstance(inv, str)
+                        else inv.get('id', inv.get('name', str(inv))) if isinstance(inv, dict)
+                        else str(inv)
+                        for inv in invitations
+                    )
             else:
-                # Dictionary (API v2 - 2024+)
-                invitations = reply.get('invitations', [])
-                # Safely handle invitations that might be dicts, strings, or mixed
-                invitation_parts = []
-                for inv in invitations:
-                    if isinstance(inv, dict):
-                        invitation_parts.append(inv.get('id', inv.get('name', str(inv))))
-                    elif isinstance(inv, str):
-                        invitation_parts.append(inv)
-                    else:
-                        invitation_parts.append(str(inv))
-                
-                invitation = ' '.join(invitation_parts) if invitation_parts else reply.get('invitation', '')
-                
-                content = reply.get('content', {})
-            
-            # Check if this is a workshop paper
-            if 'workshop' in invitation.lower():
-                is_workshop = True
-            
-            if 'Decision' in invitation:
-                # Extract decision (handle both v1 and v2 formats)
-                if isinstance(content, dict):
-                    # Check if v2 format
-                    if 'decision' in content and isinstance(content['decision'], dict) and 'value' in content['decision']:
-                        decision = content['decision']['value'].lower()
-                    else:
-                        decision = content.get('decision', '').lower()
-                else:
-                    decision = ''
-                
-                if 'accept' in decision:
-                    return 'accept'
-                elif 'reject' in decision:
-                    return 'reject'
-                elif 'poster' in decision:
-                    return 'poster'
-                elif 'oral' in decision:
-                    return 'oral'
-                elif 'spotlight' in decision:
-                    return 'spotlight'
-        
-        # If we found evidence this is a workshop paper
-        if is_workshop:
-            return 'workshop_paper'
-        
-        # Default to accept for main track
+                invitation = reply.get('invitation') or ''
+            bits = classify(invitation)
+            if not bits & _ROUTED:
+                continue
+            yield make_reply(
+                invitation,
+                bits,
+                flatten(reply.get('content', {}), is_v2),
+                reply.get('signatures', ['Anonymous']),
+                reply.get('tcdate'),
+                reply.get('cdate')
+            )
+
+
+def _review_from_reply(reply: NormalizedReply, fields: _ContentFields) -> Optional[Review]:
+    """Build a Review from one normalized reply, or None if it isn't a review"""
+    bits = reply.bits
+    content = reply.content
+    signatures = reply.signatures
+
+    # Exclude meta-reviews, decisions, and other non-review content
+    if bits & _EXCLUDED:
         return None
-    
-    @staticmethod
-    def build_paper_record(submission: Any, year: int) -> Dict:
-        """
-        Build complete paper record from submission
-        
-        Args:
-            submission: Submission object from API
-            year: Conference year
-            
-        Returns:
-            Complete paper record dictionary
-        """
+
+    # Check if this is a review (not meta-review or decision)
+    is_review = bool(bits & _REVIEW)
+
+    # Also check the content to filter out author responses
+    if is_review:
+        # Additional check: if it's from authors, skip it
+        if signatures and any('Author' in sig for sig in signatures if isinstance(sig, str)):
+            return None  # Skip author responses
+
+        # Check content for author response patterns
+        if isinstance(content, dict):
+            text_to_check = ' '.join(
+                str(content.get(field, '')) for field in _AUTHOR_TEXT_FIELDS
+            )[:200].lower()
+
+            if _AUTHOR_RESPONSE_RE.search(text_to_check):
+                return None
+
+    # For 2017 specifically
+    elif '2017' in reply.invitation:
+        is_review = bool(bits & _PAPER) and bool(bits & _REVIEW_2017)
+
+    if not is_review:
+        return None
+
+    # Extract values from content
+    if isinstance(content, dict):
+        # Field names depend on the API format (v2 content is already flattened)
+        pick = _first_present if fields.first_present else _first
+        rating = pick(content, fields.rating)
+        confidence = content.get('confidence', '')
+        review_text = pick(content, fields.review_text)
+
+        # Handle various strength/weakness formats
+        if fields.combined_strengths and 'strength_and_weaknesses' in content:
+            # Combined field (2023 and possibly others)
+            strengths = content['strength_and_weaknesses']
+            weaknesses = ''  # Combined with strengths
+        elif fields.combined_strengths and 'strengths_and_weaknesses' in content:
+            # Alternative spelling
+            strengths = content['strengths_and_weaknesses']
+            weaknesses = ''
+        else:
+            # Separate fields (most years)
+            strengths = content.get('strengths', '')
+            weaknesses = content.get('weaknesses', '')
+
+        # Try various question/comment and summary field names
+        questions = _first(content, fields.questions)
+        summary = _first(content, fields.summary)
+
+        # If review_text is empty but we have other components, combine them
+        # This is especially important for 2024 where text field is often empty
+        if not review_text and (summary or strengths or weaknesses or questions):
+            # Stream the sections into one buffer, separated by blank lines
+            buf = io.StringIO()
+            sep = ''
+
+            # Add summary first as it's usually the overview
+            if summary:
+                buf.write(f"**Summary:**\n{summary}")
+                sep = '\n\n'
+
+            # Add strengths
+            if strengths:
+                buf.write(f"{sep}**Strengths:**\n{strengths}")
+                sep = '\n\n'
+
+            # Add weaknesses
+            if weaknesses:
+                buf.write(f"{sep}**Weaknesses:**\n{weaknesses}")
+                sep = '\n\n'
+
+            # Add questions/additional comments
+            if questions:
+                buf.write(f"{sep}**Questions/Comments:**\n{questions}")
+                sep = '\n\n'
+
+            # Add any other fields that might contain review content
+            for field_name, field_label in _EXTRA_REVIEW_FIELDS:
+                field_value = content.get(field_name)
+                if field_value:
+                    buf.write(f"{sep}**{field_label}:**\n{field_value}")
+                    sep = '\n\n'
+
+            review_text = buf.getvalue()
+
+    else:
+        rating = ''
+        confidence = ''
+        review_text = ''
+        strengths = ''
+        weaknesses = ''
+        questions = ''
+        summary = ''
+
+    # Only add if there's actual review content
+    if not (review_text or summary or strengths or weaknesses):
+        return None
+
+    reviewer_id = _intern(signatures[0]) if signatures else 'Anonymous'
+
+    # Filter out author responses
+    if 'Authors' in reviewer_id:
+        return None
+
+    # Format date if available
+    if reply.tcdate:
+        date = _iso_from_ms(reply.tcdate)
+    elif reply.cdate:
+        date = _iso_from_ms(reply.cdate)
+    else:
+        date = ''
+
+    return Review(
+        reviewer_id=reviewer_id,
+        score=_intern(rating),
+        confidence=_intern(confidence),
+        text=review_text,  # This now contains the combined text
+        date=date,
+        strengths=strengths,  # Keep individual fields too
+        weaknesses=weaknesses,
+        questions=questions,
+        summary=summary
+    )
+
+
+def _meta_review_from_reply(reply: NormalizedReply, fields: _ContentFields) -> Optional[MetaReview]:
+    """Build a MetaReview from one normalized reply, or None if it has none"""
+    # Check for meta-review patterns
+    if not reply.bits & _META_REVIEW:
+        return None
+
+    content = reply.content
+
+    # Check format and extract accordingly
+    if isinstance(content, dict):
+        # Try MANY field names used across different years
+        metareview_text = _first(content, fields.meta_review)
+
+        # For 2023, check the special field names
+        if fields.meta_review_2023 and (not metareview_text or len(metareview_text) < 50):
+            # Try 2023-specific fields
+            meta_summary = content.get('metareview:_summary,_strengths_and_weaknesses', '')
+            higher_just = content.get('justification_for_why_not_higher_score', '')
+            lower_just = content.get('justification_for_why_not_lower_score', '')
+
+            # Combine available 2023 fields
+            parts = []
+            if meta_summary:
+                parts.append(meta_summary)
+            if higher_just:
+                parts.append(f"Why not higher: {higher_just}")
+            if lower_just:
+                parts.append(f"Why not lower: {lower_just}")
+
+            if parts:
+                metareview_text = '\n\n'.join(parts)
+
+        recommendation = _first(content, fields.recommendation)
+    else:
+        metareview_text = ''
+        recommendation = ''
+
+    # Only count it if we found content
+    if metareview_text or recommendation:
+        return MetaReview(text=metareview_text, decision_rationale=recommendation)
+    return None
+
+
+def _decision_from_reply(reply: NormalizedReply) -> Optional[str]:
+    """Read the acceptance decision from one normalized reply, or None"""
+    if 'Decision' not in reply.invitation:
+        return None
+
+    # Extract decision (v2 content is already flattened)
+    content = reply.content
+    if isinstance(content, dict):
+        decision = (content.get('decision') or '').lower()
+    else:
+        decision = ''
+
+    match = _DECISION_RE.match(decision)
+    return _DECISION_KEYWORDS[match.lastindex - 1] if match else None
+
+
+def extract_all(replies: List[Any], year: int = None, is_v2: bool = None) -> Tuple[List[Review], MetaReview, Optional[str]]:
+    """
+    Extract reviews, meta-review and decision in a single pass over replies
+
+    Args:
+        replies: List of reply objects
+        year: Conference year (optional, for year-specific handling)
+        is_v2: Whether replies use v2 content (detected if not given)
+
+    Returns:
+        (reviews, meta_review, decision)
+    """
+    if is_v2 is None:
+        is_v2 = _detect_v2(replies)
+
+    # Field names are fixed per API format, so look them up once per paper
+    fields = _CONTENT_FIELDS[is_v2]
+    reviews = []
+    meta_review = None
+    decision = None
+    is_workshop = False
+
+    for reply in _iter_replies(replies, is_v2):
+        bits = reply.bits
+
+        # Route by category bits; a reply can be both a review and a meta-review.
+        # Every review pattern contains 'review' or 'comment', so _REVIEW_2017
+        # is set for all review candidates, 2017 or not.
+        if bits & _REVIEW_2017 and not bits & _EXCLUDED:
+            review = _review_from_reply(reply, fields)
+            if review is not None:
+                reviews.append(review)
+
+        # The first matching meta-review and decision win, so neither is
+        # looked at again once it has been found
+        if meta_review is None and bits & _META_REVIEW:
+            meta_review = _meta_review_from_reply(reply, fields)
+
+        if decision is None:
+            if bits & _WORKSHOP:
+                is_workshop = True
+            if bits & _DECISION:
+                decision = _decision_from_reply(reply)
+
+    if meta_review is None:
+        meta_review = MetaReview()
+    if decision is None and is_workshop:
+        decision = 'workshop_paper'
+
+    return reviews, meta_review, decision
+
+
+def extract_reviews(replies: List[Any], is_v2: bool = None) -> List[Review]:
+    """
+    Extract official reviews from replies
+
+    Args:
+        replies: List of reply objects
+        is_v2: Whether replies use v2 content (detected if not given)
+
+    Returns:
+        List of processed reviews
+    """
+    return extract_all(replies, is_v2=is_v2)[0]
+
+
+def extract_meta_review(replies: List[Any], year: int = None, is_v2: bool = None) -> MetaReview:
+    """
+    Extract meta-review from replies
+
+    Args:
+        replies: List of reply objects
+        year: Conference year (optional, for year-specific handling)
+        is_v2: Whether replies use v2 content (detected if not given)
+
+    Returns:
+        Meta-review (empty if none was found)
+    """
+    return extract_all(replies, year, is_v2)[1]
+
+
+def extract_decision(replies: List[Any]) -> str:
+    """
+    Extract acceptance decision from replies
+
+    Args:
+        replies: List of reply objects
+
+    Returns:
+        Decision string (accept/reject/workshop_paper), or None
+    """
+    return extract_all(replies)[2]
+
+
+def build_paper_record(submission: Any, year: int, crawl_timestamp: str = None) -> Dict:
+    """
+    Build complete paper record from submission
+
+    Args:
+        submission: Submission object from API
+        year: Conference year
+        crawl_timestamp: ISO timestamp to record (defaults to now)
+
+    Returns:
+        Complete paper record dictionary
+    """
+    try:
+        # Read each submission attribute once
+        paper_id = getattr(submission, 'id', '')
+        number = getattr(submission, 'number', None)
+        details = getattr(submission, 'details', None)
+
+        # Extract content (already normalized if using wrapper)
+        content = getattr(submission, 'content', None) or {}
+
+        # Extract replies (v2 embeds 'replies', v1 'directReplies')
+        replies = ()
+        if isinstance(details, dict):
+            replies = details.get('replies') or details.get('directReplies') or ()
+
+        # Extract components in one pass with better error handling
+        # All replies share one format; detect it once per paper
+        is_v2 = _detect_v2(replies)
+
         try:
-            # Extract content (already normalized if using wrapper)
-            content = submission.content if hasattr(submission, 'content') else {}
-            
-            # Extract replies
-            replies = []
-            if hasattr(submission, 'details'):
-                if isinstance(submission.details, dict):
-                    replies = submission.details.get('replies', []) or submission.details.get('directReplies', [])
-                elif hasattr(submission.details, 'get'):
-                    replies = submission.details.get('replies', []) or submission.details.get('directReplies', [])
-            
-            # Extract components with better error handling
-            try:
-                reviews = PaperProcessor.extract_reviews(replies)
-            except Exception as e:
-                print(f"    DEBUG: Error in extract_reviews: {e}")
-                print(f"    DEBUG: Reply type: {type(replies[0]) if replies else 'no replies'}")
-                if replies and isinstance(replies[0], dict):
-                    print(f"    DEBUG: First reply keys: {list(replies[0].keys())[:10]}")
-                raise
-                
-            try:
-                meta_review = PaperProcessor.extract_meta_review(replies, year)
-            except Exception as e:
-                print(f"    DEBUG: Error in extract_meta_review: {e}")
-                raise
-                
-            try:
-                decision = PaperProcessor.extract_decision(replies)
-            except Exception as e:
-                print(f"    DEBUG: Error in extract_decision: {e}")
-                raise
-
-            # Build paper record
-            paper = {
-                'paper_id': submission.id if hasattr(submission, 'id') else '',
-                'year': year,
-                'title': content.get('title', ''),
-                'authors': content.get('authors', []),
-                'affiliations': [],  # Would need author profiles
-                'abstract': content.get('abstract', ''),
-                'url': f'https://openreview.net/forum?id={submission.id}' if hasattr(submission, 'id') else '',
-                'pdf_url': '',
-                'page_metadata': {
-                    'venue': f'ICLR.cc/{year}/Conference',
-                    'keywords': content.get('keywords', []),
-                    'number': submission.number if hasattr(submission, 'number') else None
-                },
-                'official_reviews': reviews,
-                'meta_review': meta_review,
-                'decision': decision,
-                'crawl_timestamp': datetime.now().isoformat()
-            }
-            
-            # Add PDF URL if available
-            if content.get('pdf'):
-                paper['pdf_url'] = f"https://openreview.net{content['pdf']}"
-            
-            return paper
-            
+            reviews, meta_review, decision = extract_all(replies, year, is_v2)
         except Exception as e:
-            print(f"    DEBUG: Error building paper record for submission {getattr(submission, 'id', 'unknown')}")
-            print(f"    DEBUG: Error type: {type(e).__name__}")
-            print(f"    DEBUG: Error message: {str(e)}")
-            raise
\ No newline at end of file
+            print(f"    DEBUG: Error in extract_all: {e}")
+            print(f"    DEBUG: Reply type: {type(replies[0]) if replies else 'no replies'}")
+            if replies and isinstance(replies[0], dict):
+                print(f"    DEBUG: First reply keys: {list(replies[0].keys())[:10]}")
+            raise
+
+        # Build paper record
+        paper = {
+            'paper_id': paper_id,
+            'year': year,
+            'title': content.get('title', ''),
+            'authors': content.get('authors', []),
+            'affiliations': [],  # Would need author profiles
+            'abstract': content.get('abstract', ''),
+            'url': f'https://openreview.net/forum?id={paper_id}' if paper_id else '',
+            'pdf_url': '',
+            'page_metadata': {
+                'venue': f'ICLR.cc/{year}/Conference',
+                'keywords': content.get('keywords', []),
+                'number': number
+            },
+            'official_reviews': reviews,
+            'meta_review': meta_review,
+            'decision': decision,
+            'crawl_timestamp': crawl_timestamp or datetime.now().isoformat()
+        }
+
+        # Add PDF URL if available
+        if content.get('pdf'):
+            paper['pdf_url'] = f"https://openreview.net{content['pdf']}"
+
+        return paper
+
+    except Exception as e:
+        print(f"    DEBUG: Error building paper record for submission {getattr(submission, 'id', 'unknown')}")
+        print(f"    DEBUG: Error type: {type(e).__name__}")
+        print(f"    DEBUG: Error message: {str(e)}")
+        raise
+
+
+def build_paper_records(submissions: List[Any], year: int) -> List[Dict]:
+    """
+    Build paper records for a batch of submissions
+
+    The crawl timestamp is taken once for the whole batch.
+
+    Args:
+        submissions: Submission objects from API
+        year: Conference year
+
+    Returns:
+        List of complete paper record dictionaries
+    """
+    crawl_timestamp = datetime.now().isoformat()
+    return [
+        build_paper_record(submission, year, crawl_timestamp)
+        for submission in submissions
+    ]
+
+
+def _build_paper_record_or_none(submission: Any, year: int, crawl_timestamp: str) -> Optional[Dict]:
+    """Worker entry point: build one record, or None if the submission fails"""
+    try:
+        return build_paper_record(submission, year, crawl_timestamp)
+    except Exception as e:
+        print(f"\n⚠️  Error processing paper: {e}")
+        return None
+
+
+def make_build_pool(workers: int = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for building paper records
+
+    Workers are spawned rather than forked: the collector already runs
+    writer and progress threads, and a forked child could inherit a lock
+    one of them holds.
+
+    Args:
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Pool to pass to iter_build_many; the caller shuts it down
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def iter_build_many(submissions: List[Any], year: int, workers: int = None, chunksize: int = 32,
+                    executor: ProcessPoolExecutor = None):
+    """
+    Build paper records for a batch of submissions in worker processes
+
+    Each record is built independently, so the batch is spread over a
+    process pool. Submissions that fail are reported and left out, as in
+    the serial collection loop.
+
+    Args:
+        submissions: Submission objects from API (must be picklable)
+        year: Conference year
+        workers: Number of worker processes when no executor is given
+        chunksize: Submissions sent to a worker at a time
+        executor: Shared pool from make_build_pool (left running afterwards)
+
+    Yields:
+        Paper record dictionaries, in submission order, as they are built
+    """
+    crawl_timestamp = datetime.now().isoformat()
+    build = partial(_build_paper_record_or_none, year=year, crawl_timestamp=crawl_timestamp)
+    own_executor = executor is None
+    if own_executor:
+        executor = make_build_pool(workers)
+    results = executor.map(build, submissions, chunksize=chunksize)
+    try:
+        for paper in results:
+            if paper is not None:
+                yield paper
+    finally:
+        # Drop this batch's queued work if the caller stops early (e.g. on interrupt)
+        results.close()
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def build_many(submissions: List[Any], year: int, workers: int = None, chunksize: int = 32) -> List[Dict]:
+    """
+    Build paper records for a batch of submissions in worker processes
+
+    Args:
+        submissions: Submission objects from API (must be picklable)
+        year: Conference year
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Submissions sent to a worker at a time
+
+    Returns:
+        List of paper record dictionaries, in submission order
+    """
+    return list(iter_build_many(submissions, year, workers, chunksize))
+
+
+class PaperProcessor:
+    """Extract and process paper data from API responses"""
+    
+    # Thin namespace over the module-level functions, kept for existing callers
+    extract_content = staticmethod(extract_content)
+    extract_all = staticmethod(extract_all)
+    extract_reviews = staticmethod(extract_reviews)
+    extract_meta_review = staticmethod(extract_meta_review)
+    extract_decision = staticmethod(extract_decision)
+    build_paper_record = staticmethod(build_paper_record)
+    build_paper_records = staticmethod(build_paper_records)
+    make_build_pool = staticmethod(make_build_pool)
+    iter_build_many = staticmethod(iter_build_many)
+    build_many = staticmethod(build_many)
@@ -1,11 +1,40 @@
 """
 Handle data storage to JSONL format
 """
-import json
+import dataclasses
+import multiprocessing
 import os
-from typing import Dict, List
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Set
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # fall back to the (slower) standard library
+    import json
+    orjson = None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _default(obj: Any) -> Any:
+        """Serialize dataclass records (reviews, meta-reviews) like orjson does"""
+        if dataclasses.is_dataclass(obj):
+            return dataclasses.asdict(obj)
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+    
+    def _dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON, matching orjson.dumps output"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+    
+    _loads = json.loads
+
+
 class Storage:
     """Handle JSONL file operations"""
     
@@ -17,72 +46,312 @@ class Storage:
             output_file: Path to output JSONL file
         """
         self.output_file = output_file
+        # Years whose collection finished, one per line; years are collected
+        # concurrently, so the JSONL tail can't tell which ones are complete
+        self.progress_file = str(Path(output_file).with_suffix('.years'))
+        # Papers are written by a single writer thread, started on first save
+        self._queue = queue.Queue()
+        self._writer = None
+        self._writer_error = None
+        # IDs of papers that couldn't be serialized (the rest of the batch is kept)
+        self.failed_ids = []
+        self._lock = threading.Lock()
         self._ensure_directory()
     
     def _ensure_directory(self):
         """Create output directory if it doesn't exist"""
         Path(self.output_file).parent.mkdir(parents=True, exist_ok=True)
     
+    def _start_writer(self):
+        """Start the writer thread if it isn't running"""
+        with self._lock:
+            if self._writer is None:
+                # Open here so a bad path or permissions fail in the caller
+                f = open(self.output_file, 'ab', buffering=1 << 16)
+                self._writer = threading.Thread(target=self._drain, args=(f,), daemon=True)
+                self._writer.start()
+    
+    def _serialize(self, papers: List[Dict]) -> bytes:
+        """Encode a batch as JSONL, skipping (and recording) papers that fail"""
+        lines = []
+        for paper in papers:
+            try:
+                lines.append(_dumps(paper))
+            except Exception as e:
+                paper_id = paper.get('paper_id') if isinstance(paper, dict) else None
+                print(f"\n⚠️  Error saving paper {paper_id}: {e}")
+                self.failed_ids.append(paper_id)
+        if not lines:
+            return b''
+        lines.append(b'')
+        return b'\n'.join(lines)
+    
+    def _drain(self, f):
+        """Writer thread: append queued batches of papers until told to stop"""
+        with f:
+            while True:
+                papers = self._queue.get()
+                try:
+                    if papers is None:
+                        return
+                    f.write(self._serialize(papers))
+                    if self._queue.empty():
+                        f.flush()
+                except Exception as e:
+                    self._writer_error = e
+                finally:
+                    self._queue.task_done()
+    
+    def _check_writer(self):
+        """Re-raise a failure from the writer thread in the caller"""
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
+    
     def save_paper(self, paper_data: Dict):
         """
         Append single paper to JSONL file
         
+        Papers are queued for the writer thread; call flush() to wait until
+        they are on disk.
+        
         Args:
             paper_data: Paper dictionary to save
         """
-        with open(self.output_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(paper_data, ensure_ascii=False) + '\n')
+        self._start_writer()
+        self._queue.put([paper_data])
     
     def save_papers(self, papers: List[Dict]):
         """
-        Save multiple papers to JSONL file
+        Save multiple papers to JSONL file as one write
         
         Args:
             papers: List of paper dictionaries
         """
-        for paper in papers:
-            self.save_paper(paper)
+        if not papers:
+            return
+        self._start_writer()
+        self._queue.put(list(papers))
+    
+    def flush(self):
+        """Wait until all queued papers are written to disk"""
+        if self._writer is not None:
+            self._queue.join()
+        self._check_writer()
+    
+    def close(self):
+        """Write queued papers and stop the writer thread"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+        self._check_writer()
+    
+    def __enter__(self) -> 'Storage':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write out queued papers and release the file handle"""
+        self.close()
     
     def clear_file(self):
         """Clear/create empty output file"""
+        self.close()
         open(self.output_file, 'w').close()
+        if os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
+    
+    def mark_year_complete(self, year: int):
+        """
+        Record that every paper of a year has been written
+        
+        Args:
+            year: Conference year that finished collecting
+        """
+        self.flush()
+        with self._lock:
+            with open(self.progress_file, 'a') as f:
+                f.write(f'{year}\n')
     
-    def read_papers(self) -> List[Dict]:
+    def completed_years(self) -> Set[int]:
+        """
+        Read the years recorded by mark_year_complete
+        
+        Returns:
+            Set of completed years (empty if none were recorded)
+        """
+        if not os.path.exists(self.progress_file):
+            return set()
+        with open(self.progress_file) as f:
+            return {int(line) for line in f if line.strip()}
+    
+    def save_arrow(self, papers: Iterable[Dict] = None, output_file: str = None,
+                   batch_rows: int = 4096) -> str:
+        """
+        Write the reviews of papers as a columnar Arrow IPC file
+        
+        One row per review, keyed by paper_id, for analytics that scan
+        scores or dates without parsing JSON. The JSONL file remains the
+        archive. Requires the optional pyarrow package, which is only
+        imported here (ImportError without it).
+        
+        Reviews are written in record batches, so memory use is bounded by
+        batch_rows rather than by the size of the archive.
+        
+        Args:
+            papers: Paper dictionaries (defaults to streaming the JSONL file)
+            output_file: Arrow file path (defaults to the JSONL path with .arrow)
+            batch_rows: Reviews buffered before each batch is written
+            
+        Returns:
+            Path of the written Arrow file
+        """
+        import pyarrow as pa
+        
+        if papers is None:
+            papers = self.iter_papers()
+        output_file = output_file or str(Path(self.output_file).with_suffix('.arrow'))
+        schema = pa.schema([
+            ('paper_id', pa.string()),
+            ('year', pa.int64()),
+            ('reviewer_id', pa.string()),
+            ('score', pa.string()),
+            ('confidence', pa.string()),
+            ('date', pa.string()),
+            ('text', pa.string())
+        ])
+        
+        with pa.OSFile(output_file, 'wb') as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                rows = []
+                for paper in papers:
+                    for review in paper.get('official_reviews', []):
+                        if dataclasses.is_dataclass(review):
+                            review = dataclasses.asdict(review)
+                        rows.append({
+                            'paper_id': paper.get('paper_id'),
+                            'year': paper.get('year'),
+                            'reviewer_id': review.get('reviewer_id'),
+                            # v1 scores are labels, v2 scores are numbers
+                            'score': str(review.get('score', '')),
+                            'confidence': str(review.get('confidence', '')),
+                            'date': review.get('date'),
+                            'text': review.get('text')
+                        })
+                    if len(rows) >= batch_rows:
+                        writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+                        rows = []
+                if rows:
+                    writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+        return output_file
+    
+    def read_papers(self, workers: int = None) -> List[Dict]:
         """
         Read all papers from JSONL file
         
+        The file is read in one call and split into lines before decoding.
+        
+        Args:
+            workers: If set, decode lines in this many worker processes
+            
+        Returns:
+            List of paper dictionaries, in file order
+        """
+        self.flush()
+        if not os.path.exists(self.output_file):
+            return []
+        
+        with open(self.output_file, 'rb') as f:
+            lines = [line for line in f.read().split(b'\n') if line.strip()]
+        
+        if workers and workers > 1:
+            # Spawn, don't fork: the writer thread may be holding a lock
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                chunksize = max(1, len(lines) // (workers * 4))
+                return list(executor.map(_loads, lines, chunksize=chunksize))
+        return [_loads(line) for line in lines]
+    
+    def iter_papers(self):
+        """
+        Stream papers from JSONL file one at a time
+        
+        Yields:
+            Paper dictionaries, in file order
+        """
+        self.flush()
+        if not os.path.exists(self.output_file):
+            return
+        with open(self.output_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+    
+    def paper_ids(self) -> Set[str]:
+        """
+        Collect the IDs of all stored papers without keeping the papers
+        
         Returns:
-            List of paper dictionaries
+            Set of paper IDs
         """
-        papers = []
-        if os.path.exists(self.output_file):
-            with open(self.output_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        papers.append(json.loads(line))
-        return papers
+        return {paper.get('paper_id') for paper in self.iter_papers()}
+    
+    def read_last_papers(self, count: int = 1000, chunk_size: int = 1 << 20) -> List[Dict]:
+        """
+        Read the last papers from JSONL file without parsing the whole file
+        
+        Args:
+            count: Maximum number of papers to return
+            chunk_size: Bytes read per backwards seek
+            
+        Returns:
+            List of up to `count` paper dictionaries, in file order
+        """
+        self.flush()
+        if not os.path.exists(self.output_file):
+            return []
+        
+        with open(self.output_file, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b''
+            # Read backwards until we hold `count` complete lines
+            while pos > 0 and data.count(b'\n') <= count:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        
+        lines = data.split(b'\n')
+        if pos > 0:
+            # First line is cut off by the seek
+            lines = lines[1:]
+        lines = [line for line in lines if line.strip()]
+        return [_loads(line) for line in lines[-count:]]
     
     def get_statistics(self) -> Dict:
         """
         Get statistics about collected data
         
+        Papers are streamed from disk, so memory use doesn't grow with the file.
+        
         Returns:
             Dictionary with statistics
         """
-        papers = self.read_papers()
-        
-        stats = {
-            'total_papers': len(papers),
-            'papers_by_year': {},
-            'total_reviews': 0,
-            'papers_with_meta_review': 0
-        }
+        # Reduce into locals rather than updating the stats dict per paper
+        papers_by_year = Counter()
+        total_reviews = 0
+        papers_with_meta_review = 0
         
-        for paper in papers:
-            year = paper.get('year', 'unknown')
-            stats['papers_by_year'][year] = stats['papers_by_year'].get(year, 0) + 1
-            stats['total_reviews'] += len(paper.get('official_reviews', []))
+        for paper in self.iter_papers():
+            papers_by_year[paper.get('year', 'unknown')] += 1
+            total_reviews += len(paper.get('official_reviews', []))
             if paper.get('meta_review', {}).get('text'):
-                stats['papers_with_meta_review'] += 1
+                papers_with_meta_review += 1
         
-        return stats
\ No newline at end of file
+        return {
+            'total_papers': sum(papers_by_year.values()),
+            'papers_by_year': dict(papers_by_year),
+            'total_reviews': total_reviews,
+            'papers_with_meta_review': papers_with_meta_review
+        }
\ No newline at end of file